@@ -3,73 +3,74 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from contextlib import suppress
-from dataclasses import asdict
-from typing import List, Optional
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from typing import AsyncIterator, List, Optional
 
+import orjson
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncScalarResult
+from starlette.background import BackgroundTask
 
 from ..core.config import get_settings
+from ..core.http import close_http, init_http
 from ..core.logging import setup_logging
+from ..db.models import ProductRecord
 from ..db.repository import fetch_products as fetch_cached_products
 from ..db.repository import upsert_products
 from ..db.session import configure_engine, init_db, session_scope
-from ..scraping.base import Product
-from ..scraping.service import collect_from_scraper, create_registry
+from ..scraping.base import Product, product_to_dict
+from ..scraping.service import ScraperRegistry, collect_from_scraper, create_registry
 from ..security.auth import verify_api_key
-from ..security.rate_limiter import RateLimiter
+from ..security.rate_limiter import TokenBucketLimiter
 from ..telemetry.events import TelemetryEvent, telemetry_client
 
 settings = get_settings()
 setup_logging(settings.log_level)
 logger = logging.getLogger("dispatch.api")
-configure_engine()
-app = FastAPI(title=settings.app_name, version="1.0.0")
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-registry = create_registry(timeout=settings.default_timeout_seconds, user_agent=settings.user_agent)
-rate_limiter = RateLimiter(max_requests=settings.request_rate_per_minute)
-scraping_task: asyncio.Task | None = None
 
 
 async def enforce_rate_limit(request: Request) -> None:
     identifier = request.client.host if request.client else "anonymous"
-    allowed = await rate_limiter.allow(identifier)
+    allowed = await request.app.state.rate_limiter.allow(identifier)
     if not allowed:
         raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="Rate limit exceeded")
 
 
 async def _persist_results(provider: str, items: List[Product]) -> int:
-    def _store() -> int:
-        with session_scope() as session:
-            return upsert_products(session, items)
+    async with session_scope() as session:
+        return await upsert_products(session, items)
+
 
-    return await asyncio.to_thread(_store)
+async def _collect_for_cycle(registry: ScraperRegistry, provider: str) -> tuple[str, List[Product] | Exception]:
+    try:
+        return provider, await collect_from_scraper(registry.get(provider), query=None, limit=None)
+    except Exception as exc:
+        return provider, exc
 
 
-async def run_scraping_cycle() -> None:
+async def run_scraping_cycle(registry: ScraperRegistry) -> None:
     logger.info("Starting scraping cycle for providers: %s", ", ".join(registry.providers))
-    tasks = [collect_from_scraper(registry.get(provider), query=None, limit=None) for provider in registry.providers]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    tasks = [asyncio.create_task(_collect_for_cycle(registry, provider)) for provider in registry.providers]
     stored = 0
-    for provider, outcome in zip(registry.providers, results):
-        if isinstance(outcome, Exception):
-            logger.error("Scraper for %s failed: %s", provider, outcome)
-            await telemetry_client.record(
-                TelemetryEvent(name="scraper.error", attributes={"provider": provider, "error": str(outcome)})
-            )
-            continue
-        stored_count = await _persist_results(provider, outcome)
-        stored += stored_count
-        logger.info("Stored %s products for provider %s", stored_count, provider)
-    await telemetry_client.record(
+    try:
+        # Persist each provider as soon as its scrape finishes rather than after the slowest one.
+        for next_done in asyncio.as_completed(tasks):
+            provider, outcome = await next_done
+            if isinstance(outcome, Exception):
+                logger.error("Scraper for %s failed: %s", provider, outcome)
+                telemetry_client.record(
+                    TelemetryEvent(name="scraper.error", attributes={"provider": provider, "error": str(outcome)})
+                )
+                continue
+            stored_count = await _persist_results(provider, outcome)
+            stored += stored_count
+            logger.info("Stored %s products for provider %s", stored_count, provider)
+    finally:
+        for task in tasks:
+            task.cancel()
+    telemetry_client.record(
         TelemetryEvent(
             name="scraper.cycle",
             attributes={
@@ -80,40 +81,57 @@ async def run_scraping_cycle() -> None:
     )
 
 
-async def background_scraper_loop() -> None:
+async def background_scraper_loop(registry: ScraperRegistry) -> None:
     while True:
         try:
-            await run_scraping_cycle()
+            await run_scraping_cycle(registry)
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.exception("Automated scraping cycle failed: %s", exc)
-            await telemetry_client.record(
+            telemetry_client.record(
                 TelemetryEvent(name="scraper.cycle.error", attributes={"error": str(exc)})
             )
         await asyncio.sleep(settings.scrape_interval_seconds)
 
 
-@app.on_event("startup")
-async def on_startup() -> None:
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Initialising Dispatch API")
-    await asyncio.to_thread(init_db)
+    configure_engine()
+    await init_db()
+    await init_http()
+    app.state.registry = create_registry(timeout=settings.default_timeout_seconds, user_agent=settings.user_agent)
+    app.state.rate_limiter = TokenBucketLimiter(max_requests=settings.request_rate_per_minute)
     await telemetry_client.start()
-    await telemetry_client.record(TelemetryEvent(name="app.startup", attributes={"environment": settings.environment}))
-    global scraping_task
-    scraping_task = asyncio.create_task(background_scraper_loop())
+    telemetry_client.record(TelemetryEvent(name="app.startup", attributes={"environment": settings.environment}))
+    scraping_task = asyncio.create_task(background_scraper_loop(app.state.registry))
     logger.info("Background scraper loop started with interval %ss", settings.scrape_interval_seconds)
 
+    yield
 
-@app.on_event("shutdown")
-async def on_shutdown() -> None:
     logger.info("Shutting down Dispatch API")
-    if scraping_task:
-        scraping_task.cancel()
-        with suppress(asyncio.CancelledError):
-            await scraping_task
-    await telemetry_client.record(TelemetryEvent(name="app.shutdown"))
+    scraping_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await scraping_task
+    await close_http()
+    telemetry_client.record(TelemetryEvent(name="app.shutdown"))
     await telemetry_client.stop()
 
 
+app = FastAPI(
+    title=settings.app_name,
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.allowed_origins,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
 @app.get("/", dependencies=[Depends(enforce_rate_limit)])
 async def root() -> dict:
     return {"service": settings.app_name, "message": "Dispatch API is online."}
@@ -125,8 +143,8 @@ async def health() -> dict:
 
 
 @app.get(f"{settings.api_v1_prefix}/providers", dependencies=[Depends(enforce_rate_limit)])
-async def list_providers() -> dict:
-    return {"providers": registry.providers}
+async def list_providers(request: Request) -> dict:
+    return {"providers": request.app.state.registry.providers}
 
 
 @app.get(f"{settings.api_v1_prefix}/products", dependencies=[Depends(enforce_rate_limit), Depends(verify_api_key)])
@@ -136,21 +154,25 @@ async def get_products(
     query: Optional[str] = Query(None, description="Optional search term."),
     limit: Optional[int] = Query(None, ge=1, le=100, description="Limit results per provider."),
 ) -> dict:
-    selected = providers or registry.providers
+    registry: ScraperRegistry = request.app.state.registry
+    selected = list(dict.fromkeys(providers or registry.providers))
+    unknown = [provider for provider in selected if not registry.has(provider)]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown providers: {', '.join(unknown)}",
+        )
     results = {}
-    tasks = []
-    for provider in selected:
-        scraper = registry.get(provider)
-        tasks.append(collect_from_scraper(scraper, query=query, limit=limit))
+    tasks = [collect_from_scraper(registry.get(provider), query=query, limit=limit) for provider in selected]
     gather_results = await asyncio.gather(*tasks, return_exceptions=True)
     for provider, outcome in zip(selected, gather_results):
         if isinstance(outcome, Exception):
-            await telemetry_client.record(
+            telemetry_client.record(
                 TelemetryEvent(name="scraper.error", attributes={"provider": provider, "error": str(outcome)})
             )
             continue
-        results[provider] = [asdict(product) for product in outcome]
-    await telemetry_client.record(
+        results[provider] = [product_to_dict(product) for product in outcome]
+    telemetry_client.record(
         TelemetryEvent(
             name="api.products",
             attributes={
@@ -164,18 +186,14 @@ async def get_products(
     return {"providers": results}
 
 
-@app.get(
-    f"{settings.api_v1_prefix}/products/cache",
-    dependencies=[Depends(enforce_rate_limit), Depends(verify_api_key)],
-)
-async def get_cached_products(
-    provider: Optional[str] = Query(None, description="Filter cached results by provider."),
-    limit: Optional[int] = Query(None, ge=1, le=500, description="Maximum number of records to return."),
-) -> dict:
-    def _fetch() -> List[dict]:
-        with session_scope() as session:
-            records = fetch_cached_products(session, provider=provider, limit=limit)
-            return [
+async def _stream_cached_products(
+    records: AsyncScalarResult[ProductRecord], session_cleanup: AsyncExitStack, provider: Optional[str]
+) -> AsyncIterator[bytes]:
+    served = 0
+    async with session_cleanup:
+        yield b'{"results":['
+        async for record in records:
+            chunk = orjson.dumps(
                 {
                     "provider": record.provider,
                     "name": record.name,
@@ -187,11 +205,33 @@ async def get_cached_products(
                     "brand": record.brand,
                     "categories": record.categories,
                     "metadata": record.attributes,
-                    "last_seen": record.last_seen.isoformat(),
+                    "last_seen": record.last_seen,
                 }
-                for record in records
-            ]
+            )
+            yield b"," + chunk if served else chunk
+            served += 1
+    yield b"]}"
+    logger.info("Served %s cached products (provider=%s)", served, provider or "all")
+
 
-    cached = await asyncio.to_thread(_fetch)
-    logger.info("Served %s cached products (provider=%s)", len(cached), provider or "all")
-    return {"results": cached}
+@app.get(
+    f"{settings.api_v1_prefix}/products/cache",
+    dependencies=[Depends(enforce_rate_limit), Depends(verify_api_key)],
+)
+async def get_cached_products(
+    provider: Optional[str] = Query(None, description="Filter cached results by provider."),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Maximum number of records to return."),
+) -> StreamingResponse:
+    # Open the session and start the query before streaming, so connection and query
+    # errors still surface as a 500 instead of a truncated 200 body.
+    async with AsyncExitStack() as stack:
+        session = await stack.enter_async_context(session_scope())
+        records = await fetch_cached_products(session, provider=provider, limit=limit)
+        session_cleanup = stack.pop_all()
+    return StreamingResponse(
+        _stream_cached_products(records, session_cleanup, provider),
+        media_type="application/json",
+        # Starlette skips the generator entirely if the client disconnects first, but always
+        # runs the background task; closing an already-emptied stack again is a no-op.
+        background=BackgroundTask(session_cleanup.aclose),
+    )
@@ -65,6 +65,20 @@ class Settings(BaseSettings):
         default="sqlite:///./dispatch.db",
         description="Database connection string used for persisting scraped products.",
     )
+    db_pool_size: int = Field(
+        default=20,
+        ge=1,
+        description="Number of persistent connections kept in the database pool.",
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Additional database connections allowed beyond the pool size under load.",
+    )
+    db_pool_recycle: int = Field(
+        default=1800,
+        description="Seconds after which pooled database connections are recycled.",
+    )
     log_level: str = Field(default="INFO", description="Application log level.")
     master_key: str | None = Field(default=None, description="Master API key generated automatically if missing.")
 
@@ -1,17 +1,50 @@
 """HTTP utilities for Dispatch scrapers."""
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+import asyncio
+from typing import Any
 
 import httpx
 
 from .config import get_settings
 
+_SETTINGS = get_settings()
+_LIMITS = httpx.Limits(max_connections=_SETTINGS.max_connections, max_keepalive_connections=_SETTINGS.max_connections)
+_HEADERS = {"User-Agent": _SETTINGS.user_agent}
+_TIMEOUT = httpx.Timeout(_SETTINGS.default_timeout_seconds)
 
-@asynccontextmanager
-async def get_async_client() -> httpx.AsyncClient:
-    settings = get_settings()
-    limits = httpx.Limits(max_connections=settings.max_connections, max_keepalive_connections=settings.max_connections)
-    headers = {"User-Agent": settings.user_agent}
-    async with httpx.AsyncClient(timeout=settings.default_timeout_seconds, limits=limits, headers=headers) as client:
-        yield client
+# Bounds in-flight scraper requests to the connection pool so callers never queue on httpx's pool timeout.
+_REQUEST_SLOTS = asyncio.Semaphore(_SETTINGS.max_connections)
+
+_CLIENT: httpx.AsyncClient | None = None
+
+
+async def init_http() -> None:
+    """Create the shared outbound HTTP client used by all scrapers."""
+
+    get_http_client()
+
+
+async def close_http() -> None:
+    """Close the shared HTTP client and release pooled connections."""
+
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(timeout=_TIMEOUT, limits=_LIMITS, headers=_HEADERS, http2=True)
+    return _CLIENT
+
+
+async def http_get(url: str, **kwargs: Any) -> httpx.Response:
+    """Issue a GET on the shared client once a connection slot is free."""
+
+    async with _REQUEST_SLOTS:
+        return await get_http_client().get(url, **kwargs)
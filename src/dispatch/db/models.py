@@ -4,10 +4,14 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, Column, DateTime, Float, Integer, String, Text, UniqueConstraint
+from sqlalchemy import JSON, Column, DateTime, Float, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 
 from .session import Base
 
+# JSONB stores the parsed document on PostgreSQL so reads skip re-parsing text.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class ProductRecord(Base):
     """SQLAlchemy representation of a scraped product."""
@@ -21,15 +25,19 @@ class ProductRecord(Base):
     url = Column(String(512), nullable=False)
     price = Column(Float, nullable=True)
     currency = Column(String(16), nullable=True)
-    images = Column(JSON, nullable=False, default=list)
+    images = Column(JSONType, nullable=False, default=list)
     description = Column(Text, nullable=True)
     brand = Column(String(255), nullable=True)
-    categories = Column(JSON, nullable=False, default=list)
-    attributes = Column(JSON, nullable=False, default=dict)
-    last_seen = Column(DateTime, default=datetime.utcnow, nullable=False)
+    categories = Column(JSONType, nullable=False, default=list)
+    attributes = Column(JSONType, nullable=False, default=dict)
+    last_seen = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
     def update_from_dict(self, data: dict[str, Any]) -> None:
         """Update the product record from a plain dictionary."""
 
         for key, value in data.items():
             setattr(self, key, value)
+
+
+# Serves the provider-filtered ``ORDER BY last_seen DESC`` query behind the cache endpoint.
+Index("ix_products_provider_last_seen", ProductRecord.provider, ProductRecord.last_seen.desc())
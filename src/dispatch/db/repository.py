@@ -2,63 +2,77 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, List, Optional
+from typing import Iterable, Optional
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
 
 from ..scraping.base import Product
 from .models import ProductRecord
 
 logger = logging.getLogger("dispatch.repository")
 
+_DIALECT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+_CONFLICT_COLUMNS = ("provider", "url")
+_FETCH_BATCH_SIZE = 100
 
-def _product_to_dict(product: Product) -> dict:
-    return {
-        "provider": product.provider,
-        "name": product.name,
-        "url": product.url,
-        "price": product.price,
-        "currency": product.currency,
-        "images": product.images,
-        "description": product.description,
-        "brand": product.brand,
-        "categories": product.categories,
-        "attributes": product.metadata,
-        "last_seen": product.last_seen,
-    }
 
+async def upsert_products(session: AsyncSession, products: Iterable[Product]) -> int:
+    """Insert or update a batch of products with a single ``INSERT ... ON CONFLICT`` statement."""
 
-def upsert_products(session: Session, products: Iterable[Product]) -> int:
-    """Insert or update a batch of products."""
+    # Deduplicate on the conflict target so the last occurrence wins; a single
+    # upsert statement may not touch the same row twice.
+    payloads = list(
+        {
+            (product.provider, product.url): {
+                "provider": product.provider,
+                "name": product.name,
+                "url": product.url,
+                "price": product.price,
+                "currency": product.currency,
+                "images": product.images,
+                "description": product.description,
+                "brand": product.brand,
+                "categories": product.categories,
+                "attributes": product.metadata,
+                "last_seen": product.last_seen,
+            }
+            for product in products
+        }.values()
+    )
+    if not payloads:
+        return 0
+    dialect = session.get_bind().dialect.name
+    try:
+        insert = _DIALECT_INSERTS[dialect]
+    except KeyError as exc:
+        raise RuntimeError(f"Bulk upsert is not supported for dialect '{dialect}'") from exc
+    stmt = insert(ProductRecord).values(payloads)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(_CONFLICT_COLUMNS),
+        set_={
+            column.name: stmt.excluded[column.name]
+            for column in ProductRecord.__table__.columns
+            if column.name != "id" and column.name not in _CONFLICT_COLUMNS
+        },
+    ).returning(ProductRecord.id)
+    result = await session.execute(stmt)
+    return len(result.scalars().all())
 
-    count = 0
-    for product in products:
-        payload = _product_to_dict(product)
-        existing = session.execute(
-            select(ProductRecord).where(
-                ProductRecord.provider == product.provider, ProductRecord.url == product.url
-            )
-        ).scalar_one_or_none()
-        if existing:
-            existing.update_from_dict(payload)
-        else:
-            session.add(ProductRecord(**payload))
-        count += 1
-    return count
 
-
-def fetch_products(
-    session: Session,
+async def fetch_products(
+    session: AsyncSession,
     *,
     provider: Optional[str] = None,
     limit: Optional[int] = None,
-) -> List[ProductRecord]:
-    """Retrieve stored products optionally filtered by provider."""
+) -> AsyncScalarResult[ProductRecord]:
+    """Stream stored products optionally filtered by provider, newest first."""
 
     stmt = select(ProductRecord).order_by(ProductRecord.last_seen.desc())
     if provider:
         stmt = stmt.where(ProductRecord.provider == provider)
     if limit:
         stmt = stmt.limit(limit)
-    return list(session.execute(stmt).scalars().all())
+    return await session.stream_scalars(stmt.execution_options(yield_per=_FETCH_BATCH_SIZE))
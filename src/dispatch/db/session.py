@@ -1,17 +1,64 @@
 """Database session management for Dispatch."""
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
 from ..core.config import get_settings
 
 Base = declarative_base()
-_engine = None
-_SessionLocal: sessionmaker[Session] | None = None
+_engine: AsyncEngine | None = None
+_SessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def _async_database_url(database_url: str) -> URL:
+    """Map plain database URLs onto their asyncio driver equivalents."""
+
+    url = make_url(database_url)
+    driver = _ASYNC_DRIVERS.get(url.drivername)
+    return url.set(drivername=driver) if driver else url
+
+
+_SETTINGS = get_settings()
+_DATABASE_URL = _async_database_url(_SETTINGS.database_url)
+
+
+_SQLITE_PRAGMAS = (
+    # WAL lets cache readers proceed while the scraping cycle commits upserts.
+    "PRAGMA journal_mode=WAL",
+    # Under WAL, NORMAL only syncs at checkpoints instead of on every commit.
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def _json_serializer(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Tune every new SQLite connection for concurrent reads and cheap commits."""
+
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 
 
 def configure_engine() -> None:
@@ -20,35 +67,55 @@ def configure_engine() -> None:
     global _engine, _SessionLocal
     if _engine is not None:
         return
-    settings = get_settings()
-    _engine = create_engine(settings.database_url, future=True)
-    _SessionLocal = sessionmaker(bind=_engine, expire_on_commit=False, future=True)
+    pool_kwargs = {}
+    if not _is_memory_sqlite(_DATABASE_URL):
+        # In-memory SQLite uses a StaticPool, which rejects queue sizing arguments.
+        pool_kwargs = {"pool_size": _SETTINGS.db_pool_size, "max_overflow": _SETTINGS.db_max_overflow}
+    _engine = create_async_engine(
+        _DATABASE_URL,
+        **pool_kwargs,
+        pool_pre_ping=True,
+        pool_recycle=_SETTINGS.db_pool_recycle,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+    )
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    _SessionLocal = async_sessionmaker(bind=_engine, expire_on_commit=False, class_=AsyncSession)
 
 
-def init_db() -> None:
+async def init_db() -> None:
     """Create database tables if they do not already exist."""
 
     if _engine is None:
         configure_engine()
     if _engine is None:
         raise RuntimeError("Database engine could not be initialised")
-    Base.metadata.create_all(bind=_engine)
+    async with _engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
+
+
+def _create_missing_indexes(connection) -> None:
+    """Add indexes declared after a table was first created; ``create_all`` skips existing tables."""
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
 
 
-@contextmanager
-def session_scope() -> Generator[Session, None, None]:
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
     """Provide a transactional scope around a series of operations."""
 
     if _SessionLocal is None:
         configure_engine()
     if _SessionLocal is None:
         raise RuntimeError("Database session factory is not initialised")
-    session = _SessionLocal()
-    try:
-        yield session
-        session.commit()
-    except Exception:  # pragma: no cover - re-raise after rollback
-        session.rollback()
-        raise
-    finally:
-        session.close()
+    async with _SessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:  # pragma: no cover - re-raise after rollback
+            await session.rollback()
+            raise
@@ -2,9 +2,19 @@
 from __future__ import annotations
 
 import abc
-from dataclasses import dataclass, field
+import asyncio
+import math
+import operator
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from itertools import islice
 from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+import httpx
+
+from ..core.http import http_get
 
 
 @dataclass(slots=True)
@@ -24,6 +34,22 @@ class Product:
     last_seen: datetime = field(default_factory=datetime.utcnow)
 
 
+_PRODUCT_FIELDS = tuple(product_field.name for product_field in fields(Product))
+_PRODUCT_VALUES = operator.attrgetter(*_PRODUCT_FIELDS)
+
+
+def product_to_dict(product: Product) -> Dict[str, Any]:
+    """Return a shallow dictionary view of ``product`` without ``asdict``'s deep copy."""
+
+    return dict(zip(_PRODUCT_FIELDS, _PRODUCT_VALUES(product)))
+
+
+def intern_label(value: Optional[str]) -> Optional[str]:
+    """Share one string object for labels such as brands that repeat across many products."""
+
+    return sys.intern(value) if value else value
+
+
 class ScraperError(RuntimeError):
     """Raised when a scraper cannot complete its task."""
 
@@ -32,6 +58,9 @@ class BaseScraper(abc.ABC):
     """Base class for site-specific scrapers."""
 
     provider: str
+    base_url: str
+    # Products per result page for scrapers that paginate; 0 means a single page is always fetched.
+    page_size: int = 0
 
     def __init__(self, *, timeout: float, user_agent: str):
         self.timeout = timeout
@@ -41,12 +70,45 @@ class BaseScraper(abc.ABC):
     async def fetch_products(self, *, query: Optional[str] = None, limit: Optional[int] = None) -> Iterable[Product]:
         """Collect products matching an optional query string."""
 
-    async def _limit(self, items: Iterable[Product], limit: Optional[int]) -> List[Product]:
-        if limit is None:
-            return list(items)
-        limited: List[Product] = []
-        for item in items:
-            limited.append(item)
-            if len(limited) >= limit:
+    def _pages_needed(self, limit: Optional[int]) -> int:
+        if not limit or not self.page_size:
+            return 1
+        return math.ceil(limit / self.page_size)
+
+    async def _get_pages(
+        self, url: str, *, params: Dict[str, Any], limit: Optional[int], **kwargs: Any
+    ) -> List[httpx.Response]:
+        """Fetch every result page needed to fill ``limit`` concurrently.
+
+        The first page is required. A failure on any later page is treated as the end
+        of the results, so the pages before it are still returned.
+        """
+
+        pages = range(1, self._pages_needed(limit) + 1)
+        first, *rest = await asyncio.gather(
+            *(http_get(url, params={**params, "page": page}, **kwargs) for page in pages),
+            return_exceptions=True,
+        )
+        if isinstance(first, BaseException):
+            raise first
+        first.raise_for_status()
+        responses = [first]
+        for response in rest:
+            if isinstance(response, BaseException) or response.is_error:
                 break
-        return limited
+            responses.append(response)
+        return responses
+
+    def _absolute_url(self, href: Optional[str]) -> str:
+        # Shopify hrefs are almost always root-relative, so avoid re-parsing base_url via urljoin.
+        if not href:
+            return self.base_url
+        if href.startswith(("https://", "http://")):
+            return href
+        if href.startswith("/") and not href.startswith("//"):
+            return self.base_url + href
+        return urljoin(self.base_url, href)
+
+    def _limit(self, items: Iterable[Product], limit: Optional[int]) -> List[Product]:
+        # Stops pulling from generator parsers once ``limit`` products have been built.
+        return list(islice(items, limit))
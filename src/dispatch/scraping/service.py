@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from .base import BaseScraper, Product, ScraperError
 from .sites.complexshop import ComplexShopScraper
@@ -17,10 +17,15 @@ class ScraperRegistry:
 
     def __init__(self, scrapers: Iterable[BaseScraper]):
         self._scrapers: Dict[str, BaseScraper] = {scraper.provider: scraper for scraper in scrapers}
+        self._provider_list: Tuple[str, ...] = tuple(sorted(self._scrapers))
+        self._provider_set: FrozenSet[str] = frozenset(self._provider_list)
 
     @property
-    def providers(self) -> List[str]:
-        return sorted(self._scrapers.keys())
+    def providers(self) -> Tuple[str, ...]:
+        return self._provider_list
+
+    def has(self, provider: str) -> bool:
+        return provider in self._provider_set
 
     def get(self, provider: str) -> BaseScraper:
         try:
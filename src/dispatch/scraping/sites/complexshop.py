@@ -1,16 +1,26 @@
 """Scraper for Complex Shop."""
 from __future__ import annotations
 
-from decimal import Decimal
-from typing import Iterable, List, Optional
-from urllib.parse import urlencode, urljoin
+import re
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urlencode
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
-from ...core.http import get_async_client
+from ...core.http import http_get
 from ...telemetry.events import TelemetryEvent, telemetry_client
 from ..base import BaseScraper, Product
 
+_CARD_SEL = "div.grid-product__content"
+_TITLE_SEL = "div.grid-product__title"
+_LINK_SEL = "a.grid-product__link"
+_PRICE_SEL = "span.grid-product__price--current"
+_IMAGE_SEL = "img"
+_IMAGE_ATTR = "data-src"
+
+_PRICE_RE = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+_CURRENCY_RE = re.compile(r"[A-Za-z$]")
+
 
 class ComplexShopScraper(BaseScraper):
     provider = "complexshop"
@@ -23,55 +33,46 @@ class ComplexShopScraper(BaseScraper):
             path = "/search"
             params["q"] = query
         url = f"{self.base_url}{path}?{urlencode(params)}"
-        async with get_async_client() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        products = self._parse_products(soup)
-        await telemetry_client.record(
-            TelemetryEvent(
-                name="scraper.fetch",
-                attributes={"provider": self.provider, "count": len(products), "query": query or ""},
+        response = await http_get(url)
+        response.raise_for_status()
+        tree = LexborHTMLParser(response.text)
+        products = self._limit(self._parse_products(tree), limit)
+        if telemetry_client.enabled:
+            telemetry_client.record(
+                TelemetryEvent(
+                    name="scraper.fetch",
+                    attributes={"provider": self.provider, "count": len(products), "query": query or ""},
+                )
             )
-        )
-        return await self._limit(products, limit)
+        return products
 
-    def _parse_products(self, soup: BeautifulSoup) -> List[Product]:
-        items: List[Product] = []
-        for card in soup.select("div.grid-product__content"):
-            title_elem = card.select_one("div.grid-product__title")
+    def _parse_products(self, tree: LexborHTMLParser) -> Iterator[Product]:
+        for card in tree.css(_CARD_SEL):
+            title_elem = card.css_first(_TITLE_SEL)
             if not title_elem:
                 continue
-            name = title_elem.get_text(strip=True)
-            url_path = card.find("a", class_="grid-product__link")
-            url = urljoin(self.base_url, url_path.get("href")) if url_path else self.base_url
-            price_elem = card.select_one("span.grid-product__price--current")
+            name = title_elem.text(strip=True)
+            url_path = card.css_first(_LINK_SEL)
+            url = self._absolute_url(url_path.attributes.get("href")) if url_path else self.base_url
+            price_elem = card.css_first(_PRICE_SEL)
             price, currency = self._parse_price(price_elem)
-            image_elem = card.find("img")
-            image_url = urljoin(self.base_url, image_elem.get("data-src")) if image_elem else None
-            items.append(
-                Product(
-                    provider=self.provider,
-                    name=name,
-                    url=url,
-                    price=price,
-                    currency=currency,
-                    images=[image_url] if image_url else [],
-                    metadata={"raw_price": price_elem.get_text(strip=True) if price_elem else None},
-                )
+            image_elem = card.css_first(_IMAGE_SEL)
+            image_url = self._absolute_url(image_elem.attributes.get(_IMAGE_ATTR)) if image_elem else None
+            yield Product(
+                provider=self.provider,
+                name=name,
+                url=url,
+                price=price,
+                currency=currency,
+                images=[image_url] if image_url else [],
+                metadata={"raw_price": price_elem.text(strip=True) if price_elem else None},
             )
-        return items
 
     def _parse_price(self, price_elem) -> tuple[Optional[float], Optional[str]]:
         if not price_elem:
             return None, None
-        raw = price_elem.get_text(strip=True).replace(",", "")
-        currency = None
-        digits = ""
-        for char in raw:
-            if char.isdigit() or char == ".":
-                digits += char
-            elif not currency and char.isalpha():
-                currency = "USD"
-        price = float(Decimal(digits)) if digits else None
+        raw = price_elem.text(strip=True).replace(",", "")
+        match = _PRICE_RE.search(raw)
+        price = float(match.group()) if match else None
+        currency = "USD" if _CURRENCY_RE.search(raw) else None
         return price, currency
@@ -1,66 +1,59 @@
 """Scraper for GOAT."""
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from itertools import chain
+from typing import Iterable, Iterator, Optional
+
+import orjson
 
-from ...core.http import get_async_client
 from ...telemetry.events import TelemetryEvent, telemetry_client
-from ..base import BaseScraper, Product
+from ..base import BaseScraper, Product, intern_label
+
+_METADATA_KEYS = ("color", "silhouette", "release_date")
 
 
 class GoatScraper(BaseScraper):
     provider = "goat"
     base_url = "https://www.goat.com"
     search_endpoint = "https://www.goat.com/web-api/v2/search"
+    page_size = 80
 
     async def fetch_products(self, *, query: Optional[str] = None, limit: Optional[int] = None) -> Iterable[Product]:
         params = {
             "query": query or "",
             "productType": "sneakers",
-            "perPage": 80,
+            "perPage": self.page_size,
         }
-        async with get_async_client() as client:
-            response = await client.get(self.search_endpoint, params=params, headers={"Accept": "application/json"})
-            response.raise_for_status()
-            payload = response.json()
-        products = self._parse_products(payload)
-        await telemetry_client.record(
-            TelemetryEvent(
-                name="scraper.fetch",
-                attributes={"provider": self.provider, "count": len(products), "query": query or ""},
-            )
+        responses = await self._get_pages(
+            self.search_endpoint, params=params, limit=limit, headers={"Accept": "application/json"}
         )
-        return await self._limit(products, limit)
+        pages = (self._parse_products(orjson.loads(response.content)) for response in responses)
+        products = self._limit(chain.from_iterable(pages), limit)
+        if telemetry_client.enabled:
+            telemetry_client.record(
+                TelemetryEvent(
+                    name="scraper.fetch",
+                    attributes={"provider": self.provider, "count": len(products), "query": query or ""},
+                )
+            )
+        return products
 
-    def _parse_products(self, payload: dict) -> List[Product]:
-        items: List[Product] = []
+    def _parse_products(self, payload: dict) -> Iterator[Product]:
         hits = payload.get("hits", [])
         for hit in hits:
             product = hit.get("_source", {})
-            name = product.get("name") or product.get("slug", "")
-            url = f"{self.base_url}/sneakers/{product.get('slug')}" if product.get("slug") else self.base_url
-            price_cents = product.get("lowest_price_cents")
-            price = price_cents / 100 if price_cents else None
-            images = []
-            if product.get("grid_default_image"):
-                images.append(product["grid_default_image"])
-            categories = product.get("category_traits") or []
-            brand = product.get("brand_name")
-            items.append(
-                Product(
-                    provider=self.provider,
-                    name=name,
-                    url=url,
-                    price=price,
-                    currency="USD",
-                    images=images,
-                    brand=brand,
-                    categories=categories,
-                    metadata={
-                        "color": product.get("color"),
-                        "silhouette": product.get("silhouette"),
-                        "release_date": product.get("release_date"),
-                    },
-                )
+            get = product.get
+            slug = get("slug")
+            price_cents = get("lowest_price_cents")
+            image = get("grid_default_image")
+            yield Product(
+                provider=self.provider,
+                name=get("name") or slug or "",
+                url=f"{self.base_url}/sneakers/{slug}" if slug else self.base_url,
+                price=price_cents / 100 if price_cents else None,
+                currency="USD",
+                images=[image] if image else [],
+                brand=intern_label(get("brand_name")),
+                categories=get("category_traits") or [],
+                metadata={key: value for key in _METADATA_KEYS if (value := get(key)) is not None},
             )
-        return items
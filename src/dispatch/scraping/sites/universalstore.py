@@ -1,78 +1,79 @@
 """Scraper for Universal Store."""
 from __future__ import annotations
 
-from decimal import Decimal
-from typing import Iterable, List, Optional
-from urllib.parse import urlencode, urljoin
+import re
+from itertools import chain
+from typing import Iterable, Iterator, Optional
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
-from ...core.http import get_async_client
 from ...telemetry.events import TelemetryEvent, telemetry_client
-from ..base import BaseScraper, Product
+from ..base import BaseScraper, Product, intern_label
+
+_CARD_SEL = "article.product-grid-item"
+_TITLE_SEL = "h3.product-grid-item__title"
+_LINK_SEL = "a.product-grid-item__link"
+_PRICE_SEL = "span.price"
+_BRAND_SEL = "p.product-grid-item__brand"
+_IMAGE_SEL = "img"
+_IMAGE_ATTR = "data-src"
+
+_PRICE_RE = re.compile(r"[0-9]+(?:\.[0-9]+)?")
 
 
 class UniversalStoreScraper(BaseScraper):
     provider = "universalstore"
     base_url = "https://www.universalstore.com"
+    page_size = 48
 
     async def fetch_products(self, *, query: Optional[str] = None, limit: Optional[int] = None) -> Iterable[Product]:
-        params = {"sz": 48}
+        params = {"sz": self.page_size}
         path = "/collections/all"
         if query:
             path = "/search"
             params["q"] = query
-        url = f"{self.base_url}{path}?{urlencode(params)}"
-        async with get_async_client() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        products = self._parse_products(soup)
-        await telemetry_client.record(
-            TelemetryEvent(
-                name="scraper.fetch",
-                attributes={"provider": self.provider, "count": len(products), "query": query or ""},
+        responses = await self._get_pages(f"{self.base_url}{path}", params=params, limit=limit)
+        pages = (self._parse_products(LexborHTMLParser(response.text)) for response in responses)
+        products = self._limit(chain.from_iterable(pages), limit)
+        if telemetry_client.enabled:
+            telemetry_client.record(
+                TelemetryEvent(
+                    name="scraper.fetch",
+                    attributes={"provider": self.provider, "count": len(products), "query": query or ""},
+                )
             )
-        )
-        return await self._limit(products, limit)
+        return products
 
-    def _parse_products(self, soup: BeautifulSoup) -> List[Product]:
-        items: List[Product] = []
-        for card in soup.select("article.product-grid-item"):
-            title_elem = card.select_one("h3.product-grid-item__title")
+    def _parse_products(self, tree: LexborHTMLParser) -> Iterator[Product]:
+        for card in tree.css(_CARD_SEL):
+            title_elem = card.css_first(_TITLE_SEL)
             if not title_elem:
                 continue
-            name = title_elem.get_text(strip=True)
-            anchor = card.find("a", class_="product-grid-item__link")
-            url = urljoin(self.base_url, anchor.get("href")) if anchor else self.base_url
-            price_elem = card.select_one("span.price")
+            name = title_elem.text(strip=True)
+            anchor = card.css_first(_LINK_SEL)
+            url = self._absolute_url(anchor.attributes.get("href")) if anchor else self.base_url
+            price_elem = card.css_first(_PRICE_SEL)
             price, currency = self._parse_price(price_elem)
-            image_elem = card.find("img")
-            image_url = urljoin(self.base_url, image_elem.get("data-src")) if image_elem else None
-            brand_elem = card.select_one("p.product-grid-item__brand")
-            brand = brand_elem.get_text(strip=True) if brand_elem else None
-            items.append(
-                Product(
-                    provider=self.provider,
-                    name=name,
-                    url=url,
-                    price=price,
-                    currency=currency,
-                    images=[image_url] if image_url else [],
-                    brand=brand,
-                    metadata={"raw_price": price_elem.get_text(strip=True) if price_elem else None},
-                )
+            image_elem = card.css_first(_IMAGE_SEL)
+            image_url = self._absolute_url(image_elem.attributes.get(_IMAGE_ATTR)) if image_elem else None
+            brand_elem = card.css_first(_BRAND_SEL)
+            brand = intern_label(brand_elem.text(strip=True)) if brand_elem else None
+            yield Product(
+                provider=self.provider,
+                name=name,
+                url=url,
+                price=price,
+                currency=currency,
+                images=[image_url] if image_url else [],
+                brand=brand,
+                metadata={"raw_price": price_elem.text(strip=True) if price_elem else None},
             )
-        return items
 
     def _parse_price(self, price_elem) -> tuple[Optional[float], Optional[str]]:
         if not price_elem:
             return None, None
-        raw = price_elem.get_text(strip=True).replace(",", "")
-        currency = "AUD" if "A$" in raw or "$" in raw else None
-        digits = ""
-        for char in raw:
-            if char.isdigit() or char == ".":
-                digits += char
-        price = float(Decimal(digits)) if digits else None
+        raw = price_elem.text(strip=True).replace(",", "")
+        currency = "AUD" if "$" in raw else None
+        match = _PRICE_RE.search(raw)
+        price = float(match.group()) if match else None
         return price, currency
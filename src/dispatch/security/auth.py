@@ -7,12 +7,12 @@ from fastapi.security import APIKeyHeader
 from ..core.config import get_settings
 
 api_key_header = APIKeyHeader(name="X-Dispatch-Key", auto_error=False)
+_API_KEYS: frozenset[str] = frozenset(get_settings().api_keys)
 
 
 def verify_api_key(api_key: str = Security(api_key_header)) -> None:
-    settings = get_settings()
-    if not settings.api_keys:
+    if not _API_KEYS:
         return
-    if api_key in settings.api_keys:
+    if api_key in _API_KEYS:
         return
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
@@ -1,29 +1,40 @@
 """Simple in-memory rate limiting."""
 from __future__ import annotations
 
-import asyncio
 import time
-from collections import defaultdict, deque
-from typing import Deque, Dict
+from collections import OrderedDict
+from typing import Tuple
 
 
-class RateLimiter:
-    """Token bucket rate limiter with per-identifier tracking."""
+class TokenBucketLimiter:
+    """Token bucket rate limiter with per-identifier tracking.
 
-    def __init__(self, *, max_requests: int, window_seconds: int = 60) -> None:
+    Each identifier holds up to ``max_requests`` tokens which refill continuously
+    over ``window_seconds``. The bucket update never awaits, so it runs atomically
+    on the event loop without a lock.
+
+    At most ``max_identifiers`` buckets are tracked; the least recently seen one is
+    evicted first. An evicted client simply starts again with a full bucket, which
+    is also the state an idle bucket refills to.
+    """
+
+    def __init__(self, *, max_requests: int, window_seconds: int = 60, max_identifiers: int = 100_000) -> None:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._events: Dict[str, Deque[float]] = defaultdict(deque)
-        self._lock = asyncio.Lock()
+        self.max_identifiers = max_identifiers
+        self._capacity = float(max_requests)
+        self._rate_per_second = max_requests / window_seconds
+        self._buckets: OrderedDict[str, Tuple[float, float]] = OrderedDict()
 
     async def allow(self, identifier: str) -> bool:
         now = time.monotonic()
-        cutoff = now - self.window_seconds
-        async with self._lock:
-            bucket = self._events[identifier]
-            while bucket and bucket[0] < cutoff:
-                bucket.popleft()
-            if len(bucket) >= self.max_requests:
-                return False
-            bucket.append(now)
-            return True
+        tokens, last = self._buckets.get(identifier, (self._capacity, now))
+        tokens = min(self._capacity, tokens + self._rate_per_second * (now - last))
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[identifier] = (tokens, now)
+        self._buckets.move_to_end(identifier)
+        if len(self._buckets) > self.max_identifiers:
+            self._buckets.popitem(last=False)
+        return allowed
@@ -3,15 +3,24 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import time
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
 
 import httpx
+import orjson
 
 from ..core.config import get_settings
 
+_BATCH_SIZE = 256
+_BATCH_WINDOW_SECONDS = 0.25
+# Oldest events are dropped beyond this so an unreachable collector cannot exhaust memory.
+_MAX_BUFFERED_EVENTS = 10_000
+_HTTP_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+_HTTP_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+_HTTP_HEADERS = {"Content-Type": "application/json"}
+
 
 @dataclass(slots=True)
 class TelemetryEvent:
@@ -19,41 +28,86 @@ class TelemetryEvent:
 
     name: str
     attributes: Dict[str, Any] = field(default_factory=dict)
-    timestamp: float = field(default_factory=lambda: time.time())
+    # Stamped by TelemetryClient.record; 0.0 means "not yet recorded".
+    timestamp: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "attributes": self.attributes, "timestamp": self.timestamp}
 
 
 class TelemetryClient:
     """In-memory telemetry buffer with optional forwarding."""
 
     def __init__(self) -> None:
-        self._events: asyncio.Queue[TelemetryEvent] = asyncio.Queue()
+        self._events: Deque[TelemetryEvent] = deque(maxlen=_MAX_BUFFERED_EVENTS)
+        self._wake = asyncio.Event()
         self._settings = get_settings()
+        self._enabled = bool(self._settings.telemetry_endpoint)
         self._sender_task: Optional[asyncio.Task[None]] = None
 
+    @property
+    def enabled(self) -> bool:
+        """Whether events are forwarded; when False, ``record`` discards them."""
+
+        return self._enabled
+
     async def start(self) -> None:
-        if self._settings.telemetry_endpoint and self._sender_task is None:
+        if self._enabled and self._sender_task is None:
             self._sender_task = asyncio.create_task(self._forward_events())
 
     async def stop(self) -> None:
-        if self._sender_task:
-            self._sender_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._sender_task
+        """Stop the forwarder and flush whatever is still buffered, including shutdown events."""
 
-    async def record(self, event: TelemetryEvent) -> None:
-        await self._events.put(event)
+        if self._sender_task is None:
+            return
+        self._sender_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._sender_task
+        self._sender_task = None
+        if not self._events:
+            return
+        async with self._open_client() as client:
+            while self._events:
+                await self._post(client, self._take(_BATCH_SIZE))
 
-    async def _forward_events(self) -> None:
+    def record(self, event: TelemetryEvent) -> None:
+        """Buffer an event without waiting; forwarding happens in the background."""
+
+        if not self._enabled:
+            return
+        if event.timestamp == 0.0:
+            event.timestamp = time.time()
+        self._events.append(event)
+        self._wake.set()
+
+    async def _next_batch(self) -> List[TelemetryEvent]:
+        while not self._events:
+            self._wake.clear()
+            await self._wake.wait()
+        if len(self._events) < _BATCH_SIZE:
+            # Give bursts a moment to accumulate so they share one POST.
+            await asyncio.sleep(_BATCH_WINDOW_SECONDS)
+        return self._take(_BATCH_SIZE)
+
+    def _take(self, count: int) -> List[TelemetryEvent]:
+        return [self._events.popleft() for _ in range(min(len(self._events), count))]
+
+    def _open_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(http2=True, timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS, headers=_HTTP_HEADERS)
+
+    async def _post(self, client: httpx.AsyncClient, batch: List[TelemetryEvent]) -> None:
         assert self._settings.telemetry_endpoint is not None
-        async with httpx.AsyncClient() as client:
+        payload = orjson.dumps([event.to_dict() for event in batch])
+        try:
+            await client.post(str(self._settings.telemetry_endpoint), content=payload)
+        except httpx.HTTPError:
+            # Swallow telemetry errors to avoid cascading failures
+            pass
+
+    async def _forward_events(self) -> None:
+        async with self._open_client() as client:
             while True:
-                event = await self._events.get()
-                payload = json.dumps(asdict(event))
-                try:
-                    await client.post(str(self._settings.telemetry_endpoint), content=payload)
-                except httpx.HTTPError:
-                    # Swallow telemetry errors to avoid cascading failures
-                    pass
+                await self._post(client, await self._next_batch())
 
 
 telemetry_client = TelemetryClient()